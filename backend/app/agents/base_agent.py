@@ -23,6 +23,10 @@ class ModelProvider(str, Enum):
     LOCAL = "local"
 
 
+# Shared LLM clients keyed by (provider, api_key, base_url)
+_llm_clients: Dict[tuple, Any] = {}
+
+
 class BaseAgent(ABC):
     """
     Base Agent class for all AI agents.
@@ -78,21 +82,64 @@ class BaseAgent(ABC):
         if self.model_provider == ModelProvider.OPENAI:
             if not settings.openai_api_key:
                 raise ValueError("OpenAI API key not configured")
-            self.openai_client = AsyncOpenAI(
-                api_key=settings.openai_api_key,
-                base_url=settings.openai_api_base
-            )
+            self.openai_client = self._get_llm_client(ModelProvider.OPENAI)
         elif self.model_provider == ModelProvider.ANTHROPIC:
             if not settings.anthropic_api_key:
                 raise ValueError("Anthropic API key not configured")
-            self.anthropic_client = AsyncAnthropic(
-                api_key=settings.anthropic_api_key,
-                base_url=settings.anthropic_api_base
-            )
+            self.anthropic_client = self._get_llm_client(ModelProvider.ANTHROPIC)
         elif self.model_provider == ModelProvider.LOCAL:
             # TODO: Implement local model support
             raise NotImplementedError("Local model support not yet implemented")
     
+    @staticmethod
+    def _get_llm_client(provider: ModelProvider) -> AsyncOpenAI | AsyncAnthropic:
+        """
+        Get the shared LLM client for a provider, creating it on first use.
+        
+        Clients hold an HTTP connection pool and SSL context, which are costly
+        to build, so all agent instances reuse one client per provider and
+        credentials instead of constructing a new one each time.
+        
+        Args:
+            provider: LLM provider (openai/anthropic)
+            
+        Returns:
+            Shared async client for the provider
+        """
+        if provider == ModelProvider.OPENAI:
+            key = (provider, settings.openai_api_key, settings.openai_api_base)
+        else:
+            key = (provider, settings.anthropic_api_key, settings.anthropic_api_base)
+        
+        client = _llm_clients.get(key)
+        if client is None:
+            if provider == ModelProvider.OPENAI:
+                client = AsyncOpenAI(
+                    api_key=settings.openai_api_key,
+                    base_url=settings.openai_api_base
+                )
+            else:
+                client = AsyncAnthropic(
+                    api_key=settings.anthropic_api_key,
+                    base_url=settings.anthropic_api_base
+                )
+            _llm_clients[key] = client
+        
+        return client
+    
+    @classmethod
+    def preload(cls):
+        """
+        Create the shared LLM clients for all configured providers.
+        
+        Call once at startup (e.g. in a worker thread) so the first agent
+        construction does not pay client setup cost on the event loop.
+        """
+        if settings.openai_api_key:
+            cls._get_llm_client(ModelProvider.OPENAI)
+        if settings.anthropic_api_key:
+            cls._get_llm_client(ModelProvider.ANTHROPIC)
+    
     def get_tool(self, tool_name: str):
         """Get tool by name
         
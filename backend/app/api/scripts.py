@@ -1,5 +1,6 @@
 """Python Script Management API"""
 
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Optional
 from pydantic import BaseModel
@@ -375,8 +376,8 @@ async def test_script(
                 detail=f"Script {script_id} not found"
             )
         
-        # Execute script
-        exec_result = script_executor.execute(script.code, timeout=30)
+        # Execute script (runs a subprocess, keep it off the event loop)
+        exec_result = await asyncio.to_thread(script_executor.execute, script.code, 30)
         
         return {
             "success": exec_result["success"],
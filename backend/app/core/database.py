@@ -1,5 +1,8 @@
 """Database Connection Management"""
 
+import asyncio
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -30,6 +33,10 @@ AsyncSessionLocal = async_sessionmaker(
 # Base class for models
 Base = declarative_base()
 
+# Upper bound (seconds) on the startup pool warm-up, so an unreachable
+# database doesn't hold up app startup for the driver's connect timeout
+WARM_POOL_TIMEOUT = 5
+
 
 async def init_db():
     """Initialize database connection"""
@@ -46,9 +53,35 @@ async def init_db():
     from app.core.database_security import setup_database_security
     setup_database_security()
     
+    # Pre-open pooled connections so first requests skip the handshake
+    try:
+        await asyncio.wait_for(warm_pool(), timeout=WARM_POOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Database pool warm-up timed out after {WARM_POOL_TIMEOUT}s")
+    except Exception as e:
+        logger.warning(f"Failed to warm database pool: {str(e)}")
+    
     logger.info("Database initialized with security measures")
 
 
+async def warm_pool(size: int = 5):
+    """Pre-open connections in the engine pool
+    
+    Opens ``size`` connections concurrently and returns them to the pool,
+    so subsequent sessions reuse established connections instead of paying
+    TCP and authentication setup on first use.
+    
+    Args:
+        size: Number of connections to open (capped at the pool size)
+    """
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    size = min(size, engine.pool.size())
+    await asyncio.gather(*(_ping() for _ in range(size)))
+
+
 async def close_db():
     """Close database connection"""
     await engine.dispose()
@@ -9,7 +9,7 @@ Provides utilities for secure database operations including:
 
 import logging
 import re
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from datetime import datetime
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -18,21 +18,27 @@ from app.core.security import APIKeyEncryption
 
 logger = logging.getLogger(__name__)
 
+# Runs of characters that are not allowed in full-text search queries
+_SEARCH_QUERY_SEPARATOR_RE = re.compile(r'[^\w.-]+')
+
 
 class DatabaseSecurityValidator:
     """Validator for database input security"""
     
     # Patterns that might indicate SQL injection attempts
+    # Keywords and function prefixes are anchored with \b so they don't
+    # fire inside ordinary words (e.g. "backdrop", "wxp_")
     SQL_INJECTION_PATTERNS = [
-        r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|EXECUTE)\b)",
+        r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|TRUNCATE|EXEC|EXECUTE)\b)",
         r"(--|;|\/\*|\*\/)",
-        r"(\bOR\b.*=.*)",
-        r"(\bAND\b.*=.*)",
-        r"('.*--)",
-        r"(UNION.*SELECT)",
-        r"(xp_.*\()",
+        r"(\b(OR|AND)\b.*=)",
+        r"(\bUNION\b.*\bSELECT\b)",
+        r"(\b(xp|sp)_\w+\s*\()",
     ]
     
+    # Patterns compiled once, in the same order
+    _SQL_INJECTION_RES = tuple(re.compile(p, re.IGNORECASE) for p in SQL_INJECTION_PATTERNS)
+    
     @classmethod
     def validate_input(cls, value: str, field_name: str = "input") -> bool:
         """Validate input for potential SQL injection
@@ -48,16 +54,35 @@ class DatabaseSecurityValidator:
             return True
         
         # Check for SQL injection patterns
-        for pattern in cls.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, value, re.IGNORECASE):
+        for regex in cls._SQL_INJECTION_RES:
+            if regex.search(value):
                 logger.warning(
                     f"Potential SQL injection detected in {field_name}: "
-                    f"matched pattern {pattern}"
+                    f"matched pattern {regex.pattern}"
                 )
                 return False
         
         return True
     
+    @classmethod
+    def validate_batch(cls, values: Iterable[Any], field_name: str = "input") -> list[bool]:
+        """Validate many inputs for potential SQL injection
+        
+        Values are checked one by one with validate_input; joining them with a
+        separator would let the '.*' patterns match across neighbouring values.
+        
+        Args:
+            values: Input values to validate
+            field_name: Name of the field (for logging)
+            
+        Returns:
+            One flag per value, True if that input is safe
+        """
+        return [
+            cls.validate_input(value, f"{field_name}[{index}]")
+            for index, value in enumerate(values)
+        ]
+    
     @classmethod
     def sanitize_search_query(cls, query: str) -> str:
         """Sanitize search query for full-text search
@@ -68,12 +93,10 @@ class DatabaseSecurityValidator:
         Returns:
             Sanitized query string
         """
-        # Remove special characters that could cause issues
-        # Keep only alphanumeric, spaces, and basic punctuation
-        sanitized = re.sub(r'[^\w\s\-_.]', ' ', query)
-        
-        # Remove multiple spaces
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        # Replace special characters and collapse whitespace in one pass:
+        # keep only alphanumeric and basic punctuation, turning every run of
+        # anything else (spaces included) into a single space
+        sanitized = _SEARCH_QUERY_SEPARATOR_RE.sub(' ', query)
         
         # Trim
         sanitized = sanitized.strip()
@@ -0,0 +1,51 @@
+"""Event Loop Utilities
+
+Helpers for running standalone async entry points (scripts, tools).
+"""
+
+import asyncio
+import logging
+from typing import Any, Coroutine, TypeVar
+
+# Optional import for faster event loop (installed with uvicorn[standard], not on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def run_async(main: Coroutine[Any, Any, T], eager_tasks: bool = False) -> T:
+    """Run a coroutine to completion on the fastest available event loop
+
+    Uses uvloop when it is installed and falls back to the default asyncio
+    event loop otherwise.
+
+    Args:
+        main: Coroutine to run
+        eager_tasks: Install asyncio's eager task factory (Python 3.12+) so
+            tasks that finish without suspending skip an event loop round-trip.
+            Ignored on older Python versions.
+
+    Returns:
+        The coroutine's result
+    """
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    else:
+        logger.debug("uvloop not available, using default asyncio event loop")
+
+    if eager_tasks and hasattr(asyncio, "eager_task_factory"):
+        main = _with_eager_tasks(main)
+
+    return asyncio.run(main)
+
+
+async def _with_eager_tasks(main: Coroutine[Any, Any, T]) -> T:
+    """Install the eager task factory on the running loop, then await main"""
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    return await main
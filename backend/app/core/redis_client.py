@@ -7,8 +7,14 @@ redis_client: redis.Redis = None
 
 
 async def init_redis():
-    """Initialize Redis connection"""
+    """Initialize Redis connection
+    
+    Idempotent: if a client already exists it is reused, so repeated calls
+    share one connection pool instead of opening a new one.
+    """
     global redis_client
+    if redis_client is not None:
+        return
     redis_client = redis.from_url(
         settings.redis_url,
         encoding="utf-8",
@@ -22,6 +28,7 @@ async def close_redis():
     global redis_client
     if redis_client:
         await redis_client.close()
+        redis_client = None
 
 
 async def get_redis() -> redis.Redis:
@@ -11,7 +11,7 @@ import base64
 
 # Optional import for encryption
 try:
-    from cryptography.fernet import Fernet
+    from cryptography.fernet import Fernet, MultiFernet
     CRYPTOGRAPHY_AVAILABLE = True
 except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
@@ -29,36 +29,67 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Translation table deleting characters that can never form a dangerous
+# filename pattern; names made only of these skip the regex checks
+_SAFE_FILENAME_CHARS = dict.fromkeys(
+    map(ord, "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._- ")
+)
+
+# Characters stripped from filenames, and runs of separators collapsed to '-'
+_FILENAME_INVALID_CHARS_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[-\s]+')
+
 
 class APIKeyEncryption:
     """Encryption utilities for API keys"""
     
+    # Cached cipher, built once from the configured keys
+    _fernet: Optional["MultiFernet"] = None
+    
     @staticmethod
-    def _get_encryption_key() -> bytes:
-        """Get or generate encryption key
+    def _get_encryption_keys() -> list[bytes]:
+        """Get or generate encryption keys
+        
+        ENCRYPTION_KEY may hold several comma-separated Fernet keys to
+        support rotation: the first encrypts, all are tried to decrypt.
         
         Returns:
-            Encryption key bytes
+            List of Fernet keys (url-safe base64 encoded)
         """
         if not CRYPTOGRAPHY_AVAILABLE:
             raise RuntimeError("cryptography library not available. Install with: pip install cryptography")
         
-        # Try to get key from environment
-        key_str = os.getenv('ENCRYPTION_KEY')
+        # Try to get keys from environment / .env
+        key_str = settings.encryption_key or os.getenv('ENCRYPTION_KEY')
         
         if not key_str:
             # Generate a new key (should be stored securely in production)
-            key = Fernet.generate_key()
             logger.warning("No ENCRYPTION_KEY found in environment. Generated new key. "
                          "Please set ENCRYPTION_KEY in .env for production use.")
-            return key
+            return [Fernet.generate_key()]
         
-        # Decode base64 key
-        try:
-            return base64.urlsafe_b64decode(key_str)
-        except Exception as e:
-            logger.error(f"Failed to decode encryption key: {str(e)}")
-            raise ValueError("Invalid encryption key format")
+        return [key.strip().encode() for key in key_str.split(',') if key.strip()]
+    
+    @classmethod
+    def _get_fernet(cls) -> "MultiFernet":
+        """Get the cached cipher, creating it on first use
+        
+        Building a Fernet instance decodes and splits the key; caching it
+        avoids that on every call and keeps a generated fallback key stable
+        for the lifetime of the process.
+        
+        Returns:
+            MultiFernet over the configured keys
+        """
+        if APIKeyEncryption._fernet is None:
+            try:
+                APIKeyEncryption._fernet = MultiFernet(
+                    [Fernet(key) for key in cls._get_encryption_keys()]
+                )
+            except (ValueError, TypeError) as e:
+                logger.error(f"Failed to load encryption key: {str(e)}")
+                raise ValueError("Invalid encryption key format")
+        return APIKeyEncryption._fernet
     
     @classmethod
     def encrypt_api_key(cls, api_key: str) -> str:
@@ -78,9 +109,7 @@ class APIKeyEncryption:
             return api_key
         
         try:
-            key = cls._get_encryption_key()
-            f = Fernet(key)
-            encrypted = f.encrypt(api_key.encode())
+            encrypted = cls._get_fernet().encrypt(api_key.encode())
             return base64.urlsafe_b64encode(encrypted).decode()
         except Exception as e:
             logger.error(f"Failed to encrypt API key: {str(e)}")
@@ -104,10 +133,8 @@ class APIKeyEncryption:
             return encrypted_key
         
         try:
-            key = cls._get_encryption_key()
-            f = Fernet(key)
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_key)
-            decrypted = f.decrypt(encrypted_bytes)
+            decrypted = cls._get_fernet().decrypt(encrypted_bytes)
             return decrypted.decode()
         except Exception as e:
             logger.error(f"Failed to decrypt API key: {str(e)}")
@@ -155,6 +182,9 @@ class FileSecurityValidator:
         r'[\x00-\x1f]',  # Control characters
     ]
     
+    # Dangerous patterns compiled once, in the same order
+    _DANGEROUS_RES = tuple(re.compile(p) for p in DANGEROUS_PATTERNS)
+    
     @classmethod
     def validate_filename(cls, filename: str) -> Tuple[bool, Optional[str]]:
         """Validate filename for security issues
@@ -168,10 +198,18 @@ class FileSecurityValidator:
         if not filename:
             return False, "Filename cannot be empty"
         
-        # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, filename):
-                return False, f"Filename contains dangerous pattern: {pattern}"
+        # Check for dangerous patterns. Common names (plain ASCII letters,
+        # digits, '.', '_', '-', ' ', not hidden, no '..') can't match any of
+        # them, so only the rest go through the regexes
+        is_plain = (
+            not filename.translate(_SAFE_FILENAME_CHARS)
+            and not filename.startswith('.')
+            and '..' not in filename
+        )
+        if not is_plain:
+            for regex in cls._DANGEROUS_RES:
+                if regex.search(filename):
+                    return False, f"Filename contains dangerous pattern: {regex.pattern}"
         
         # Check filename length
         if len(filename) > 255:
@@ -198,8 +236,8 @@ class FileSecurityValidator:
         name, ext = os.path.splitext(filename)
         
         # Remove dangerous characters
-        name = re.sub(r'[^\w\s-]', '', name)
-        name = re.sub(r'[-\s]+', '-', name)
+        name = _FILENAME_INVALID_CHARS_RE.sub('', name)
+        name = _FILENAME_SEPARATOR_RE.sub('-', name)
         name = name.strip('-')
         
         # Limit length
@@ -1,5 +1,7 @@
 """FastAPI Application Entry Point"""
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -7,6 +9,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
+from app.agents.base_agent import BaseAgent
 from app.core.database import init_db, close_db
 from app.core.redis_client import init_redis, close_redis
 from app.core.exceptions import AppException
@@ -31,6 +34,8 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     await init_redis()
+    # Create shared LLM clients off the event loop
+    await asyncio.to_thread(BaseAgent.preload)
     # Setup logging filters
     setup_logging_filters()
     yield
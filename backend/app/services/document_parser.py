@@ -4,9 +4,10 @@ Parses various document formats and extracts text content.
 Supports: Word (.doc/.docx), PDF (.pdf), Markdown (.md), Excel (.xls/.xlsx), TXT (.txt), and URLs.
 """
 
+import codecs
 import io
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 from pathlib import Path
 
 import docx
@@ -122,11 +123,12 @@ class DocumentParser:
             raise DocumentParseError(f"Failed to parse URL content: {str(e)}")
     
     @classmethod
-    def extract_text(cls, content: bytes, file_type: str) -> str:
+    def extract_text(cls, content: bytes | str, file_type: str) -> str:
         """Extract text from binary content
         
         Args:
-            content: Binary content
+            content: Binary content (plain text may also be passed as str,
+                which is returned as-is for 'txt' without a decode)
             file_type: File type/extension (e.g., 'docx', 'pdf')
             
         Returns:
@@ -147,15 +149,50 @@ class DocumentParser:
             elif file_type in ['xls', 'xlsx']:
                 return cls._parse_excel_bytes(content)
             elif file_type == 'txt':
-                return content.decode('utf-8')
+                return cls._decode_text(content)
             else:
                 raise DocumentParseError(f"Unsupported file type: {file_type}")
         except Exception as e:
             logger.error(f"Failed to extract text from {file_type}: {str(e)}")
             raise DocumentParseError(f"Failed to extract text: {str(e)}")
     
+    @classmethod
+    def parse_bytes_streaming(cls, chunks: Iterable[bytes]) -> str:
+        """Decode plain text content delivered in chunks
+        
+        Uses an incremental UTF-8 decoder so large uploads can be decoded
+        as they are read, without first joining them into a single bytes
+        object. Multi-byte characters split across chunks are handled.
+        
+        Args:
+            chunks: Iterable of raw byte chunks
+            
+        Returns:
+            Decoded text content
+            
+        Raises:
+            DocumentParseError: If the content is not valid UTF-8
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        
+        try:
+            parts = [decoder.decode(chunk) for chunk in chunks]
+            parts.append(decoder.decode(b'', final=True))
+        except UnicodeDecodeError as e:
+            logger.error(f"Failed to decode text stream: {str(e)}")
+            raise DocumentParseError(f"Failed to extract text: {str(e)}")
+        
+        return ''.join(parts)
+    
     # Private parsing methods
     
+    @staticmethod
+    def _decode_text(content: bytes | str) -> str:
+        """Decode plain text bytes as UTF-8 (str is returned as-is)"""
+        if isinstance(content, str):
+            return content
+        return content.decode('utf-8')
+    
     @staticmethod
     def _parse_docx(file_path: str) -> str:
         """Parse Word document (.doc and .docx)
@@ -27,6 +27,11 @@ class KnowledgeBaseError(Exception):
     pass
 
 
+def _is_empty_search(self, query: str, kb_type: Optional[str] = None, limit: int = 5) -> bool:
+    """Skip the search cache for requests that cannot return results"""
+    return limit <= 0
+
+
 class KnowledgeBaseService:
     """Service for managing knowledge base documents"""
     
@@ -170,7 +175,18 @@ class KnowledgeBaseService:
             logger.error(f"Failed to add URL: {str(e)}")
             raise KnowledgeBaseError(f"Failed to add URL: {str(e)}")
     
-    @cache_response("kb:search", ttl=1800)  # Cache for 30 minutes
+    async def probe(self) -> bool:
+        """Check that the database behind the service is reachable
+        
+        Cheap liveness check that avoids running a full-text search.
+        
+        Returns:
+            True if the database answered
+        """
+        result = await self.db.execute(text("SELECT 1"))
+        return result.scalar() == 1
+    
+    @cache_response("kb:search", ttl=1800, skip_cache=_is_empty_search)  # Cache for 30 minutes
     async def search(
         self,
         query: str,
@@ -187,6 +203,9 @@ class KnowledgeBaseService:
         Returns:
             List of search results with relevance ranking
         """
+        if limit <= 0:
+            return []
+        
         try:
             # Build full-text search query
             # Using PostgreSQL's to_tsquery for search
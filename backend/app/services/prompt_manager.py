@@ -143,14 +143,15 @@ class PromptManager:
         if agent_type in self._cache:
             return self._cache[agent_type]
         
-        # Load from file
+        # Load from file (single open instead of exists() + read)
         prompt_file = self.prompts_dir / f"{agent_type}.txt"
-        if prompt_file.exists():
+        try:
             prompt = prompt_file.read_text(encoding="utf-8")
-            self._cache[agent_type] = prompt
-            return prompt
+        except FileNotFoundError:
+            return None
         
-        return None
+        self._cache[agent_type] = prompt
+        return prompt
     
     def set_prompt(self, agent_type: str, prompt: str) -> bool:
         """
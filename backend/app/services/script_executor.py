@@ -5,6 +5,7 @@ Includes built-in scripts for common test data generation.
 """
 
 import ast
+import functools
 import logging
 import subprocess
 import sys
@@ -37,20 +38,28 @@ class ScriptExecutor:
     """Service for executing Python scripts in a sandboxed environment"""
     
     # Dangerous modules that should be blocked
-    BLOCKED_MODULES = {
+    BLOCKED_MODULES = frozenset({
         'os', 'subprocess', 'sys', 'shutil', 'pathlib',
         'socket', 'urllib', 'requests', 'http',
         'multiprocessing', 'threading', 'asyncio',
         'importlib', '__import__', 'eval', 'exec',
         'compile', 'open', 'file', 'input'
-    }
+    })
     
     # Allowed standard library modules
-    ALLOWED_MODULES = {
+    ALLOWED_MODULES = frozenset({
         'random', 'string', 'datetime', 'time', 'json',
         'math', 're', 'collections', 'itertools', 'functools',
         'hashlib', 'base64', 'uuid'
-    }
+    })
+    
+    # Built-in functions that scripts may not call
+    DANGEROUS_FUNCTIONS = frozenset({'eval', 'exec', 'compile', '__import__', 'open'})
+    
+    # Interpreter flags for the sandbox subprocess: -I for isolated mode
+    # (ignores PYTHON* env vars and the user site-packages). site itself is
+    # still imported since it defines the exit()/quit() builtins scripts use
+    INTERPRETER_FLAGS = ('-I',)
     
     # Built-in scripts for common test data generation
     BUILTIN_SCRIPTS = {
@@ -238,7 +247,7 @@ print(generate_password())
                 if os.name == 'nt':  # Windows
                     # Windows doesn't support preexec_fn, use basic timeout only
                     result = subprocess.run(
-                        [sys.executable, '-I', temp_file_path],  # -I for isolated mode
+                        [sys.executable, *cls.INTERPRETER_FLAGS, temp_file_path],
                         capture_output=True,
                         text=True,
                         timeout=timeout,
@@ -248,7 +257,7 @@ print(generate_password())
                     )
                 else:  # Unix/Linux
                     result = subprocess.run(
-                        [sys.executable, '-I', temp_file_path],  # -I for isolated mode
+                        [sys.executable, *cls.INTERPRETER_FLAGS, temp_file_path],
                         capture_output=True,
                         text=True,
                         timeout=timeout,
@@ -293,44 +302,53 @@ print(generate_password())
         Returns:
             True if script is valid and safe, False otherwise
         """
+        reason = cls._validate_cached(script_code)
+        if reason is not None:
+            logger.warning(reason)
+            return False
+        
+        return True
+    
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _validate_cached(cls, script_code: str) -> Optional[str]:
+        """Check a script and return the rejection reason, or None if it is safe
+        
+        Only the decision is memoized per script source, so re-validating an
+        unchanged script skips parsing and the AST walk while validate_script
+        still logs every rejection.
+        """
         try:
             # Parse the script
             tree = ast.parse(script_code)
-            
-            # Check for dangerous imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        module_name = alias.name.split('.')[0]
-                        if module_name in cls.BLOCKED_MODULES:
-                            logger.warning(f"Blocked dangerous import: {module_name}")
-                            return False
-                        if module_name not in cls.ALLOWED_MODULES:
-                            logger.warning(f"Import not in allowed list: {module_name}")
-                            return False
-                            
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        module_name = node.module.split('.')[0]
-                        if module_name in cls.BLOCKED_MODULES:
-                            logger.warning(f"Blocked dangerous import from: {module_name}")
-                            return False
-                        if module_name not in cls.ALLOWED_MODULES:
-                            logger.warning(f"Import from not in allowed list: {module_name}")
-                            return False
-                
-                # Block dangerous function calls
-                elif isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name):
-                        if node.func.id in ['eval', 'exec', 'compile', '__import__', 'open']:
-                            logger.warning(f"Blocked dangerous function call: {node.func.id}")
-                            return False
-            
-            return True
-            
         except SyntaxError as e:
-            logger.warning(f"Script syntax error: {str(e)}")
-            return False
+            return f"Script syntax error: {str(e)}"
+        
+        # Check for dangerous imports
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    module_name = alias.name.split('.')[0]
+                    if module_name in cls.BLOCKED_MODULES:
+                        return f"Blocked dangerous import: {module_name}"
+                    if module_name not in cls.ALLOWED_MODULES:
+                        return f"Import not in allowed list: {module_name}"
+                        
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    module_name = node.module.split('.')[0]
+                    if module_name in cls.BLOCKED_MODULES:
+                        return f"Blocked dangerous import from: {module_name}"
+                    if module_name not in cls.ALLOWED_MODULES:
+                        return f"Import from not in allowed list: {module_name}"
+            
+            # Block dangerous function calls
+            elif isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    if node.func.id in cls.DANGEROUS_FUNCTIONS:
+                        return f"Blocked dangerous function call: {node.func.id}"
+        
+        return None
     
     @classmethod
     def extract_dependencies(cls, script_code: str) -> List[str]:
@@ -12,11 +12,32 @@ from datetime import datetime
 
 import redis.asyncio as redis
 
+# Optional import for faster JSON (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Any) -> bytes | str:
+    """Serialize session data to JSON (UTF-8, non-ASCII kept as-is)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _loads(json_data: bytes | str) -> Any:
+    """Deserialize session data from JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(json_data)
+    return json.loads(json_data)
+
+
 class SessionError(Exception):
     """Exception raised for session operations"""
     pass
@@ -103,17 +124,16 @@ class SessionManager:
             key = self._make_key(session_id, step)
             
             # Serialize data to JSON
-            json_data = json.dumps(data, ensure_ascii=False)
+            json_data = _dumps(data)
             
-            # Save to Redis with expiration
-            await self.redis.setex(
-                key,
-                self.expire_seconds,
-                json_data
-            )
+            # Save to Redis with expiration and fetch metadata in one round-trip
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(key, self.expire_seconds, json_data)
+                pipe.get(self._make_key(session_id, self.METADATA_SUFFIX))
+                _, metadata_json = await pipe.execute()
             
             # Update metadata
-            metadata = await self.get_metadata(session_id)
+            metadata = self._load_metadata(metadata_json)
             if metadata:
                 metadata['current_step'] = step
                 metadata['last_accessed'] = datetime.utcnow().isoformat()
@@ -146,17 +166,20 @@ class SessionManager:
         try:
             key = self._make_key(session_id, step)
             
-            # Get from Redis
-            json_data = await self.redis.get(key)
+            # Get step data and metadata from Redis in one round-trip
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.get(self._make_key(session_id, self.METADATA_SUFFIX))
+                json_data, metadata_json = await pipe.execute()
             
             if json_data is None:
                 return None
             
             # Deserialize JSON
-            data = json.loads(json_data)
+            data = _loads(json_data)
             
             # Update last accessed time
-            metadata = await self.get_metadata(session_id)
+            metadata = self._load_metadata(metadata_json)
             if metadata:
                 metadata['last_accessed'] = datetime.utcnow().isoformat()
                 await self.save_metadata(session_id, metadata)
@@ -180,7 +203,7 @@ class SessionManager:
         """
         try:
             key = self._make_key(session_id, self.METADATA_SUFFIX)
-            json_data = json.dumps(metadata, ensure_ascii=False)
+            json_data = _dumps(metadata)
             
             await self.redis.setex(
                 key,
@@ -205,11 +228,26 @@ class SessionManager:
             key = self._make_key(session_id, self.METADATA_SUFFIX)
             json_data = await self.redis.get(key)
             
-            if json_data is None:
-                return None
-            
-            return json.loads(json_data)
+        except Exception as e:
+            logger.error(f"Failed to get metadata: {str(e)}")
+            return None
+        
+        return self._load_metadata(json_data)
+    
+    def _load_metadata(self, json_data: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Deserialize raw session metadata
+        
+        Args:
+            json_data: Raw JSON string from Redis, or None
             
+        Returns:
+            Metadata dictionary or None if missing or invalid
+        """
+        if json_data is None:
+            return None
+        
+        try:
+            return _loads(json_data)
         except Exception as e:
             logger.error(f"Failed to get metadata: {str(e)}")
             return None
@@ -276,9 +314,11 @@ class SessionManager:
             if not keys:
                 return False
             
-            # Extend expiration for all keys
-            for key in keys:
-                await self.redis.expire(key, self.expire_seconds)
+            # Extend expiration for all keys in one round-trip
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.expire(key, self.expire_seconds)
+                await pipe.execute()
             
             logger.debug(f"Extended session: {session_id}")
             return True
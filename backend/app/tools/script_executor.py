@@ -1,10 +1,13 @@
 """Script Executor Tool"""
 
+import asyncio
+import json
+import time
 from typing import Dict, Any, Optional
 from pydantic import Field
 
 from app.tools.base import BaseTool, ToolInput, ToolOutput
-from app.services.script_executor import ScriptExecutor
+from app.services.script_executor import ScriptExecutor, ScriptExecutionError
 
 
 class ScriptExecuteInput(ToolInput):
@@ -51,15 +54,27 @@ class ScriptExecutorTool(BaseTool):
         Returns:
             执行结果
         """
-        result = await self.executor.execute(
-            script_code=input_data.script_code,
-            params=input_data.params,
-            timeout=input_data.timeout
-        )
+        input_text = json.dumps(input_data.params, ensure_ascii=False) if input_data.params else None
+        
+        # 脚本在子进程中同步执行，放到线程中运行以免阻塞事件循环
+        start_time = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(
+                self.executor.execute,
+                input_data.script_code,
+                input_data.timeout,
+                input_text
+            )
+        except ScriptExecutionError as e:
+            return ScriptExecuteOutput(
+                success=False,
+                error=str(e),
+                execution_time=time.perf_counter() - start_time
+            )
         
         return ScriptExecuteOutput(
             success=result.get("success", False),
-            result=result.get("result"),
-            error=result.get("error"),
-            execution_time=result.get("execution_time", 0.0)
+            result=result.get("output"),
+            error=result.get("error") or None,
+            execution_time=time.perf_counter() - start_time
         )
@@ -3,7 +3,6 @@
 This script initializes the database by running Alembic migrations.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -14,6 +13,7 @@ from alembic import command
 from alembic.config import Config
 from app.core.config import settings
 from app.core.database import engine, Base
+from app.core.event_loop import run_async
 
 
 async def init_database():
@@ -37,4 +37,4 @@ async def init_database():
 
 
 if __name__ == "__main__":
-    asyncio.run(init_database())
+    run_async(init_database())
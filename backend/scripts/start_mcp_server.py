@@ -7,7 +7,6 @@ Usage:
 """
 
 import sys
-import asyncio
 import logging
 from pathlib import Path
 
@@ -15,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.mcp.server import TestKnowledgeMCPServer
+from app.core.event_loop import run_async
 
 # Configure logging
 logging.basicConfig(
@@ -48,4 +48,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
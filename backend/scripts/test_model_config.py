@@ -1,6 +1,5 @@
 """Test Model Configuration and Prompt Management"""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -9,7 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.services.prompt_manager import prompt_manager
-from app.agents.factory import create_requirement_agent
+from app.core.event_loop import run_async
 
 
 async def test_model_config():
@@ -73,6 +72,10 @@ async def test_agent_factory():
     print("=" * 60)
     
     try:
+        # Imported here so the config/prompt checks don't pay for loading
+        # the agent stack and LLM SDKs
+        from app.agents.factory import create_requirement_agent
+        
         print("\n1. Creating Requirement Agent with default config:")
         agent = create_requirement_agent()
         print(f"   Agent Type: {agent.agent_type}")
@@ -123,4 +126,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
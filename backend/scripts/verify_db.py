@@ -3,7 +3,6 @@
 This script verifies that the database is properly set up with all tables and seed data.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -13,92 +12,99 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import text
 from app.core.database import engine, AsyncSessionLocal
 from app.core.config import settings
+from app.core.event_loop import run_async
+
+TABLES = (
+    'agent_configs',
+    'knowledge_bases',
+    'python_scripts',
+    'case_templates',
+    'test_cases',
+)
+
+# Count all tables and probe the full-text search setup in a single
+# round-trip; EXISTS stops at the first catalog match. Built once at import.
+VERIFY_STATEMENT = text("SELECT " + ", ".join(
+    [f"(SELECT COUNT(*) FROM {table}) AS {table}" for table in TABLES] + [
+        """EXISTS (
+            SELECT 1 FROM pg_indexes
+            WHERE tablename = 'knowledge_bases'
+            AND indexname = 'idx_knowledge_search'
+        ) AS has_search_index""",
+        """EXISTS (
+            SELECT 1 FROM pg_trigger
+            WHERE tgname = 'tsvector_update'
+        ) AS has_search_trigger""",
+    ]
+))
 
 
 async def verify_database():
-    """Verify database setup"""
-    print("🔍 Verifying database setup...")
-    print(f"📍 Database URL: {settings.database_url}")
+    """Verify database setup
+    
+    Output is collected and written to stdout in one call at the end.
+    """
+    lines = []
+    log = lines.append
+    
+    log("🔍 Verifying database setup...")
+    log(f"📍 Database URL: {settings.database_url}")
     
     try:
         async with AsyncSessionLocal() as session:
             # Check if tables exist
-            print("\n📋 Checking tables...")
-            tables = [
-                'agent_configs',
-                'knowledge_bases',
-                'python_scripts',
-                'case_templates',
-                'test_cases'
-            ]
-            
-            for table in tables:
-                result = await session.execute(
-                    text(f"SELECT COUNT(*) FROM {table}")
-                )
-                count = result.scalar()
-                print(f"  ✅ {table}: {count} rows")
+            log("\n📋 Checking tables...")
+            result = await session.execute(VERIFY_STATEMENT)
+            counts = result.mappings().one()
+            for table in TABLES:
+                log(f"  ✅ {table}: {counts[table]} rows")
             
             # Check builtin scripts
-            print("\n🔧 Checking builtin scripts...")
+            log("\n🔧 Checking builtin scripts...")
             result = await session.execute(
                 text("SELECT name FROM python_scripts WHERE is_builtin = true ORDER BY name")
             )
-            scripts = result.fetchall()
+            scripts = result.scalars().all()
             if scripts:
-                for script in scripts:
-                    print(f"  ✅ {script[0]}")
+                for script_name in scripts:
+                    log(f"  ✅ {script_name}")
             else:
-                print("  ⚠️  No builtin scripts found")
+                log("  ⚠️  No builtin scripts found")
             
             # Check default agent configs
-            print("\n🤖 Checking default agent configurations...")
+            log("\n🤖 Checking default agent configurations...")
             result = await session.execute(
                 text("SELECT agent_type, agent_name FROM agent_configs WHERE is_default = true ORDER BY agent_type")
             )
             configs = result.fetchall()
             if configs:
                 for config in configs:
-                    print(f"  ✅ {config[0]}: {config[1]}")
+                    log(f"  ✅ {config[0]}: {config[1]}")
             else:
-                print("  ⚠️  No default agent configs found")
+                log("  ⚠️  No default agent configs found")
             
             # Check full-text search setup
-            print("\n🔎 Checking full-text search setup...")
-            result = await session.execute(
-                text("""
-                    SELECT COUNT(*) 
-                    FROM pg_indexes 
-                    WHERE tablename = 'knowledge_bases' 
-                    AND indexname = 'idx_knowledge_search'
-                """)
-            )
-            index_count = result.scalar()
-            if index_count > 0:
-                print("  ✅ Full-text search index exists")
+            log("\n🔎 Checking full-text search setup...")
+            if counts['has_search_index']:
+                log("  ✅ Full-text search index exists")
             else:
-                print("  ⚠️  Full-text search index not found")
+                log("  ⚠️  Full-text search index not found")
             
             # Check trigger
-            result = await session.execute(
-                text("""
-                    SELECT COUNT(*) 
-                    FROM pg_trigger 
-                    WHERE tgname = 'tsvector_update'
-                """)
-            )
-            trigger_count = result.scalar()
-            if trigger_count > 0:
-                print("  ✅ Auto-update trigger exists")
+            if counts['has_search_trigger']:
+                log("  ✅ Auto-update trigger exists")
             else:
-                print("  ⚠️  Auto-update trigger not found")
+                log("  ⚠️  Auto-update trigger not found")
             
-            print("\n✅ Database verification completed successfully!")
+            log("\n✅ Database verification completed successfully!")
             return True
             
     except Exception as e:
-        print(f"\n❌ Database verification failed: {e}")
+        log(f"\n❌ Database verification failed: {e}")
         return False
+    
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def test_connection():
@@ -138,4 +144,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -8,32 +8,78 @@ Checkpoint 12 Verification Script
 3. 确保WebSocket连接正常
 """
 
+import asyncio
 import os
 import sys
 import time
-import requests
+import httpx
 import json
+from http import HTTPStatus
 from pathlib import Path
 
-# Colors for terminal output
+# Optional faster JSON parser
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Status codes that count as "endpoint reachable" (404 is ok for empty lists)
+ENDPOINT_OK_STATUSES = frozenset({HTTPStatus.OK, HTTPStatus.NOT_FOUND})
+
+# Endpoints whose body is never inspected (e.g. the Swagger HTML page);
+# probed with HEAD so only the status line and headers are transferred
+STATUS_ONLY_ENDPOINTS = frozenset({"/docs"})
+
+# Errors meaning the server could not be reached at all
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Colors for terminal output (disabled when stdout is redirected to a file or pipe)
+_TTY = sys.stdout.isatty()
+
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    END = '\033[0m'
+    GREEN = '\033[92m' if _TTY else ''
+    RED = '\033[91m' if _TTY else ''
+    YELLOW = '\033[93m' if _TTY else ''
+    BLUE = '\033[94m' if _TTY else ''
+    END = '\033[0m' if _TTY else ''
+
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓{Colors.END} "
+_ERROR_PREFIX = f"{Colors.RED}✗{Colors.END} "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠{Colors.END} "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ{Colors.END} "
 
 def print_success(msg):
-    print(f"{Colors.GREEN}✓{Colors.END} {msg}")
+    sys.stdout.write(f"{_SUCCESS_PREFIX}{msg}\n")
 
 def print_error(msg):
-    print(f"{Colors.RED}✗{Colors.END} {msg}")
+    sys.stdout.write(f"{_ERROR_PREFIX}{msg}\n")
 
 def print_warning(msg):
-    print(f"{Colors.YELLOW}⚠{Colors.END} {msg}")
+    sys.stdout.write(f"{_WARNING_PREFIX}{msg}\n")
 
 def print_info(msg):
-    print(f"{Colors.BLUE}ℹ{Colors.END} {msg}")
+    sys.stdout.write(f"{_INFO_PREFIX}{msg}\n")
+
+def find_existing_files(file_paths):
+    """返回 file_paths 中存在的文件集合
+
+    按目录分组，每个目录只调用一次 os.scandir，而不是对每个文件各 stat 一次。
+    """
+    by_dir = {}
+    for file_path in file_paths:
+        by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+
+    existing = set()
+    for directory, paths in by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            continue
+        existing.update(p for p in paths if os.path.basename(p) in present)
+
+    return existing
 
 def check_backend_structure():
     """检查后端项目结构"""
@@ -53,9 +99,10 @@ def check_backend_structure():
         "backend/.env"
     ]
     
+    existing = find_existing_files(required_files)
     all_exist = True
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_path in existing:
             print_success(f"文件存在: {file_path}")
         else:
             print_error(f"文件缺失: {file_path}")
@@ -84,9 +131,10 @@ def check_frontend_structure():
         "frontend/src/stores/useGenerationStore.ts"
     ]
     
+    existing = find_existing_files(required_files)
     all_exist = True
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_path in existing:
             print_success(f"文件存在: {file_path}")
         else:
             print_error(f"文件缺失: {file_path}")
@@ -94,7 +142,39 @@ def check_frontend_structure():
     
     return all_exist
 
-def check_backend_api(base_url="http://localhost:8000"):
+async def fetch_status_only(client, endpoint):
+    """请求 endpoint 但不下载响应体
+
+    优先使用 HEAD（FastAPI 的 /docs 等 Starlette 路由会自动支持 HEAD），
+    服务器不支持 HEAD 时退回到流式 GET，并在读取 body 前关闭响应。
+    """
+    response = await client.head(endpoint, follow_redirects=True)
+    if response.status_code != HTTPStatus.METHOD_NOT_ALLOWED:
+        return response
+
+    async with client.stream("GET", endpoint) as response:
+        return response
+
+async def probe_endpoints(client, endpoints):
+    """在同一个 client 上并发请求多个端点
+
+    Returns:
+        与 endpoints 顺序一致的 (endpoint, description, response, error) 列表，
+        请求失败时 response 为 None，error 为异常对象
+    """
+    async def probe(endpoint, description):
+        try:
+            if endpoint in STATUS_ONLY_ENDPOINTS:
+                response = await fetch_status_only(client, endpoint)
+            else:
+                response = await client.get(endpoint)
+            return endpoint, description, response, None
+        except Exception as e:
+            return endpoint, description, None, e
+
+    return await asyncio.gather(*(probe(endpoint, description) for endpoint, description in endpoints))
+
+async def check_backend_api(client):
     """检查后端API是否可访问"""
     print("\n" + "="*60)
     print("3. 检查后端API连接")
@@ -107,25 +187,23 @@ def check_backend_api(base_url="http://localhost:8000"):
     ]
     
     all_ok = True
-    for endpoint, description in endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            if response.status_code == 200:
-                print_success(f"{description} ({endpoint}): 状态码 {response.status_code}")
-            else:
-                print_warning(f"{description} ({endpoint}): 状态码 {response.status_code}")
-                all_ok = False
-        except requests.exceptions.ConnectionError:
+    for endpoint, description, response, error in await probe_endpoints(client, endpoints):
+        if isinstance(error, CONNECT_ERRORS):
             print_error(f"{description} ({endpoint}): 无法连接到后端服务器")
             print_warning("请确保后端服务器正在运行: uvicorn app.main:app --reload")
             all_ok = False
-        except Exception as e:
-            print_error(f"{description} ({endpoint}): {str(e)}")
+        elif error is not None:
+            print_error(f"{description} ({endpoint}): {str(error)}")
+            all_ok = False
+        elif response.status_code == HTTPStatus.OK:
+            print_success(f"{description} ({endpoint}): 状态码 {response.status_code}")
+        else:
+            print_warning(f"{description} ({endpoint}): 状态码 {response.status_code}")
             all_ok = False
     
     return all_ok
 
-def check_api_endpoints(base_url="http://localhost:8000"):
+async def check_api_endpoints(client):
     """检查关键API端点"""
     print("\n" + "="*60)
     print("4. 检查关键API端点")
@@ -140,22 +218,32 @@ def check_api_endpoints(base_url="http://localhost:8000"):
     ]
     
     all_ok = True
-    for endpoint, description in get_endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            if response.status_code in [200, 404]:  # 404 is ok for empty lists
-                print_success(f"{description} ({endpoint}): 可访问")
-            else:
-                print_warning(f"{description} ({endpoint}): 状态码 {response.status_code}")
-        except requests.exceptions.ConnectionError:
+    for endpoint, description, response, error in await probe_endpoints(client, get_endpoints):
+        if isinstance(error, CONNECT_ERRORS):
             print_error(f"{description} ({endpoint}): 无法连接")
             all_ok = False
-        except Exception as e:
-            print_error(f"{description} ({endpoint}): {str(e)}")
+        elif error is not None:
+            print_error(f"{description} ({endpoint}): {str(error)}")
             all_ok = False
+        elif response.status_code in ENDPOINT_OK_STATUSES:
+            print_success(f"{description} ({endpoint}): 可访问")
+        else:
+            print_warning(f"{description} ({endpoint}): 状态码 {response.status_code}")
     
     return all_ok
 
+async def run_api_checks(base_url="http://localhost:8000"):
+    """用一个共享的 HTTP 客户端依次执行后端 API 检查
+
+    Returns:
+        (backend_api, api_endpoints) 检查结果
+    """
+    async with httpx.AsyncClient(base_url=base_url, timeout=5) as client:
+        backend_api = await check_backend_api(client)
+        api_endpoints = await check_api_endpoints(client)
+
+    return backend_api, api_endpoints
+
 def check_frontend_build():
     """检查前端是否可以构建"""
     print("\n" + "="*60)
@@ -171,20 +259,19 @@ def check_frontend_build():
     
     # Check package.json
     try:
-        with open("frontend/package.json", "r", encoding="utf-8") as f:
-            package_json = json.load(f)
-            print_success(f"项目名称: {package_json.get('name')}")
-            print_success(f"版本: {package_json.get('version')}")
-            
-            # Check key dependencies
-            deps = package_json.get('dependencies', {})
-            key_deps = ['react', 'react-router-dom', 'antd', 'axios', 'zustand']
-            for dep in key_deps:
-                if dep in deps:
-                    print_success(f"依赖已配置: {dep} ({deps[dep]})")
-                else:
-                    print_error(f"依赖缺失: {dep}")
-                    return False
+        package_json = json_loads(Path("frontend/package.json").read_bytes())
+        print_success(f"项目名称: {package_json.get('name')}")
+        print_success(f"版本: {package_json.get('version')}")
+        
+        # Check key dependencies
+        deps = package_json.get('dependencies', {})
+        key_deps = ['react', 'react-router-dom', 'antd', 'axios', 'zustand']
+        for dep in key_deps:
+            if dep in deps:
+                print_success(f"依赖已配置: {dep} ({deps[dep]})")
+            else:
+                print_error(f"依赖缺失: {dep}")
+                return False
     except Exception as e:
         print_error(f"读取 package.json 失败: {str(e)}")
         return False
@@ -203,9 +290,10 @@ def check_websocket_endpoint(base_url="ws://localhost:8000"):
         "frontend/src/components/Generate/StreamingOutput.tsx"
     ]
     
+    existing = find_existing_files(ws_files)
     all_exist = True
     for file_path in ws_files:
-        if os.path.exists(file_path):
+        if file_path in existing:
             print_success(f"WebSocket相关文件存在: {file_path}")
         else:
             print_error(f"WebSocket相关文件缺失: {file_path}")
@@ -226,11 +314,15 @@ def main():
     print("Checkpoint 12: 前端功能完成验证")
     print("="*60)
     
+    backend_structure = check_backend_structure()
+    frontend_structure = check_frontend_structure()
+    backend_api, api_endpoints = asyncio.run(run_api_checks())
+    
     results = {
-        "backend_structure": check_backend_structure(),
-        "frontend_structure": check_frontend_structure(),
-        "backend_api": check_backend_api(),
-        "api_endpoints": check_api_endpoints(),
+        "backend_structure": backend_structure,
+        "frontend_structure": frontend_structure,
+        "backend_api": backend_api,
+        "api_endpoints": api_endpoints,
         "frontend_build": check_frontend_build(),
         "websocket": check_websocket_endpoint()
     }